@@ -1,3 +1,6 @@
+import os
+
+import numpy as np
 import tensorflow as tf
 
 from nalp.corpus import TextCorpus
@@ -5,28 +8,64 @@ from nalp.datasets import LanguageModelingDataset
 from nalp.encoders import IntegerEncoder
 from nalp.models.generators import StackedRNNGenerator
 
-# Creating a character TextCorpus from file
-corpus = TextCorpus(from_file='data/text/chapter1_harry.txt', corpus_type='char')
+# If a GPU is available, uses a mixed precision policy to benefit from Tensor Cores
+# Note that `fit` automatically applies loss scaling under this policy
+if tf.config.list_physical_devices('GPU'):
+    tf.keras.mixed_precision.set_global_policy('mixed_float16')
 
-# Creating an IntegerEncoder, learning encoding and encoding tokens
-encoder = IntegerEncoder()
-encoder.learn(corpus.vocab_index, corpus.index_vocab)
-encoded_tokens = encoder.encode(corpus.tokens)
+# Enables XLA auto-clustering, fusing the training step into fewer kernels
+tf.config.optimizer.set_jit(True)
 
-# Creating Language Modeling Dataset
-dataset = LanguageModelingDataset(encoded_tokens, max_contiguous_pad_length=10, batch_size=64)
+# Defining the corpus parameters and a cache prefix that changes whenever they do
+file_name, corpus_type, min_frequency = 'data/text/chapter1_harry.txt', 'char', 1
+cache = (f'cache/{os.path.basename(file_name)}_{corpus_type}_{min_frequency}_'
+         f'{int(os.path.getmtime(file_name))}')
+
+# Checks if the corpus has already been pre-processed and encoded
+if os.path.exists(f'{cache}_tokens.npy'):
+    # Loading the vocabulary and memory-mapping the encoded tokens
+    vocab = np.load(f'{cache}_vocab.npy').tolist()
+    encoded_tokens = np.load(f'{cache}_tokens.npy', mmap_mode='r')
+
+    # Creating an IntegerEncoder and learning encoding
+    encoder = IntegerEncoder()
+    encoder.learn(dict(zip(vocab, range(len(vocab)))), vocab)
+
+else:
+    # Creating a character TextCorpus from file
+    corpus = TextCorpus(from_file=file_name, corpus_type=corpus_type, min_frequency=min_frequency)
+    vocab = corpus.vocab
 
-# Creating the StackedRNN
-rnn = StackedRNNGenerator(encoder=encoder, vocab_size=corpus.vocab_size,
-                          embedding_size=256, hidden_size=(128, 256, 512))
+    # Creating an IntegerEncoder, learning encoding and encoding tokens
+    encoder = IntegerEncoder()
+    encoder.learn(corpus.vocab_index, corpus.index_vocab)
+    encoded_tokens = encoder.encode(corpus.tokens)
+
+    # Saving the vocabulary and encoded tokens for further runs
+    os.makedirs('cache', exist_ok=True)
+    np.save(f'{cache}_vocab.npy', np.array(vocab))
+    np.save(f'{cache}_tokens.npy', encoded_tokens)
+
+# Creating a data-parallel strategy that mirrors the model across every available GPU
+strategy = tf.distribute.MirroredStrategy()
+
+# Creating Language Modeling Dataset
+# Note that the global batch size is split between the replicas
+dataset = LanguageModelingDataset(encoded_tokens, max_contiguous_pad_length=10,
+                                  batch_size=64 * strategy.num_replicas_in_sync)
 
-# As NALP's StackedRNNs are stateful, we need to build it with a fixed batch size
-rnn.build((64, None))
+# Variables must be created under the strategy's scope to be mirrored
+with strategy.scope():
+    # Creating a stateless StackedRNN, as stateful RNNs are not supported by distribution strategies
+    # Note that for generating text, a stateful StackedRNN should load the trained weights
+    rnn = StackedRNNGenerator(encoder=encoder, vocab_size=len(vocab),
+                              embedding_size=256, hidden_size=(128, 256, 512), stateful=False)
 
-# Compiling the StackedRNN
-rnn.compile(optimizer=tf.optimizers.Adam(learning_rate=0.001),
-            loss=tf.losses.SparseCategoricalCrossentropy(from_logits=True),
-            metrics=[tf.metrics.SparseCategoricalAccuracy(name='accuracy')])
+    # Compiling the StackedRNN
+    # Note that if `n_sampled` is used, metrics are only calculated when evaluating
+    rnn.compile(optimizer=tf.optimizers.Adam(learning_rate=0.001),
+                loss=tf.losses.SparseCategoricalCrossentropy(from_logits=True),
+                metrics=[tf.metrics.SparseCategoricalAccuracy(name='accuracy')])
 
 # Fitting the StackedRNN
 rnn.fit(dataset.batches, epochs=100)
@@ -1,8 +1,10 @@
 """A core package, containing all the basic class and functions that serves as
     the foundation of NALP common modules.
+
+Note that the tensorflow-based classes are not imported by the package, which keeps
+corpus and encoder workflows from loading tensorflow. They should be imported from
+`nalp.core.dataset` and `nalp.core.model` instead.
 """
 
 from nalp.core.corpus import Corpus
-from nalp.core.dataset import Dataset
 from nalp.core.encoder import Encoder
-from nalp.core.model import Adversarial, Discriminator, Generator
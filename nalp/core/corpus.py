@@ -78,7 +78,7 @@ class Corpus:
 
     @property
     def index_vocab(self):
-        """dict: Maps indexes to vocabulary tokens.
+        """list: Maps indexes to vocabulary tokens.
 
         """
 
@@ -131,25 +131,50 @@ class Corpus:
         # Calculates the frequency of tokens
         tokens_frequency = Counter(self.tokens)
 
-        # Iterates over every possible sentence
-        # Using index is a caveat due to lists immutable property
-        for i, _ in enumerate(self.tokens):
-            # If frequency of token is smaller than minimum frequency
-            if tokens_frequency[self.tokens[i]] < self.min_frequency:
-                # Replaces with an unknown token
-                self.tokens[i] = c.UNK
+        # Gathers the tokens which frequency is smaller than minimum frequency
+        rare_tokens = {t for t, f in tokens_frequency.items() if f < self.min_frequency}
 
-    def _build(self):
+        # Replaces every rare token with an unknown token
+        if rare_tokens:
+            self.tokens = [c.UNK if t in rare_tokens else t for t in self.tokens]
+
+    def _build(self, unique_tokens=None):
         """Builds the vocabulary based on the tokens.
 
+        Args:
+            unique_tokens (set): Unique tokens, if already known, to avoid another pass over the tokens.
+
         """
 
+        if unique_tokens is None:
+            unique_tokens = set(self.tokens)
+
         # Creates the vocabulary
-        self.vocab = sorted(set(self.tokens).union({c.UNK}))
+        self.vocab = sorted(unique_tokens.union({c.UNK}))
 
         # Also, gathers the vocabulary size
         self.vocab_size = len(self.vocab)
 
         # Creates a property mapping vocabulary to indexes and vice-versa
-        self.vocab_index = {t: i for i, t in enumerate(self.vocab)}
-        self.index_vocab = {i: t for i, t in enumerate(self.vocab)}
+        # Note that as indexes are contiguous, the vocabulary itself maps them to tokens
+        self.vocab_index = dict(zip(self.vocab, range(self.vocab_size)))
+        self.index_vocab = self.vocab
+
+    def _cut_and_build(self):
+        """Cuts tokens that do not meet a minimum frequency value and builds the vocabulary,
+        sharing a single frequency calculation between both steps.
+
+        """
+
+        # Calculates the frequency of tokens
+        tokens_frequency = Counter(self.tokens)
+
+        # Gathers the tokens which frequency is smaller than minimum frequency
+        rare_tokens = {t for t, f in tokens_frequency.items() if f < self.min_frequency}
+
+        # Replaces every rare token with an unknown token
+        if rare_tokens:
+            self.tokens = [c.UNK if t in rare_tokens else t for t in self.tokens]
+
+        # Builds the vocabulary based on the remaining unique tokens
+        self._build(tokens_frequency.keys() - rare_tokens)
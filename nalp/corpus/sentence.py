@@ -2,12 +2,13 @@
 """
 
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from itertools import chain
 
 import nalp.utils.constants as c
 import nalp.utils.loader as l
 import nalp.utils.logging as log
-from nalp.core import Corpus
+from nalp.core.corpus import Corpus
 
 logger = log.get_logger(__name__)
 
@@ -21,7 +22,7 @@ class SentenceCorpus(Corpus):
     """
 
     def __init__(self, tokens=None, from_file=None, corpus_type='char', min_frequency=1,
-                 max_pad_length=None, sos_eos_tokens=True):
+                 max_pad_length=None, sos_eos_tokens=True, n_workers=1):
         """Initialization method.
 
         Args:
@@ -31,6 +32,7 @@ class SentenceCorpus(Corpus):
             min_frequency (int): Minimum frequency of individual tokens.
             max_pad_length (int): Maximum length to pad the tokens.
             sos_eos_tokens (bool): Whether start-of-sentence and end-of-sentence tokens should be used.
+            n_workers (int): Number of processes used to tokenize the sentences.
 
         """
 
@@ -47,7 +49,7 @@ class SentenceCorpus(Corpus):
             pipe = self._create_tokenizer(corpus_type)
 
             # Retrieve the tokens
-            self.tokens = [pipe(sentence) for sentence in sentences]
+            self.tokens = self._tokenize_sentences(sentences, pipe, n_workers)
 
         else:
             # Gathers them to the property
@@ -68,6 +70,30 @@ class SentenceCorpus(Corpus):
                      sos_eos_tokens, len(self.vocab))
         logger.info('SentenceCorpus created.')
 
+    def _tokenize_sentences(self, sentences, pipe, n_workers):
+        """Tokenizes the sentences, splitting them across processes if more than a worker is used.
+
+        Args:
+            sentences (list): A list of sentences.
+            pipe (callable): A pre-processing pipeline.
+            n_workers (int): Number of processes used to tokenize the sentences.
+
+        Returns:
+            A list of tokens per sentence.
+
+        """
+
+        if n_workers <= 1:
+            return [pipe(sentence) for sentence in sentences]
+
+        # Gathers a chunk size that amortizes the inter-process communication
+        chunk_size = max(1, len(sentences) // (4 * n_workers))
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            tokens = list(executor.map(pipe, sentences, chunksize=chunk_size))
+
+        return tokens
+
     def _check_token_frequency(self):
         """Cuts tokens that do not meet a minimum frequency value.
 
@@ -76,15 +102,13 @@ class SentenceCorpus(Corpus):
         # Calculates the frequency of tokens
         tokens_frequency = Counter(chain.from_iterable(self.tokens))
 
-        # Iterates over every possible sentence
-        # Using index is a caveat due to lists immutable property
-        for i, _ in enumerate(self.tokens):
-            # Iterates over every token in the sentence
-            for j, _ in enumerate(self.tokens[i]):
-                # If frequency of token is smaller than minimum frequency
-                if tokens_frequency[self.tokens[i][j]] < self.min_frequency:
-                    # Replaces with an unknown token
-                    self.tokens[i][j] = c.UNK
+        # Gathers the tokens which frequency is smaller than minimum frequency
+        rare_tokens = {t for t, f in tokens_frequency.items() if f < self.min_frequency}
+
+        # Replaces every rare token of every sentence with an unknown token
+        if rare_tokens:
+            self.tokens = [[c.UNK if t in rare_tokens else t for t in tokens]
+                           for tokens in self.tokens]
 
     def _pad_token(self, max_pad_length, sos_eos_tokens):
         """Pads the tokens into a fixed length.
@@ -121,12 +145,18 @@ class SentenceCorpus(Corpus):
 
         """
 
+        # Gathers the unique tokens by updating a set with every sentence
+        vocab = {c.UNK}
+        for tokens in self.tokens:
+            vocab.update(tokens)
+
         # Creates the vocabulary
-        self.vocab = sorted(set(chain.from_iterable(self.tokens)).union({c.UNK}))
+        self.vocab = sorted(vocab)
 
         # Also, gathers the vocabulary size
         self.vocab_size = len(self.vocab)
 
         # Creates a property mapping vocabulary to indexes and vice-versa
-        self.vocab_index = {t: i for i, t in enumerate(self.vocab)}
-        self.index_vocab = {i: t for i, t in enumerate(self.vocab)}
+        # Note that as indexes are contiguous, the vocabulary itself maps them to tokens
+        self.vocab_index = dict(zip(self.vocab, range(self.vocab_size)))
+        self.index_vocab = self.vocab
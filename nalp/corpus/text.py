@@ -3,7 +3,7 @@
 
 import nalp.utils.loader as l
 import nalp.utils.logging as log
-from nalp.core import Corpus
+from nalp.core.corpus import Corpus
 
 logger = log.get_logger(__name__)
 
@@ -46,11 +46,8 @@ class TextCorpus(Corpus):
             # Gathers them to the property
             self.tokens = tokens
 
-        # Cuts the tokens based on a minimum frequency
-        self._check_token_frequency()
-
-        # Builds the vocabulary based on the tokens
-        self._build()
+        # Cuts the tokens based on a minimum frequency and builds the vocabulary
+        self._cut_and_build()
 
         logger.debug('Tokens: %d | Minimum frequency: %d | Vocabulary size: %d.',
                      len(self.tokens), self.min_frequency, len(self.vocab))
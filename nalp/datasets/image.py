@@ -4,7 +4,7 @@
 from tensorflow import data
 
 import nalp.utils.logging as l
-from nalp.core import Dataset
+from nalp.core.dataset import Dataset
 
 logger = l.get_logger(__name__)
 
@@ -1,10 +1,11 @@
 """Language modeling dataset class.
 """
 
+import tensorflow as tf
 from tensorflow import data
 
 import nalp.utils.logging as l
-from nalp.core import Dataset
+from nalp.core.dataset import Dataset
 
 logger = l.get_logger(__name__)
 
@@ -32,7 +33,13 @@ class LanguageModelingDataset(Dataset):
 
         # Creates the sequences and maps their inputs and targets
         sequences = self._create_sequences(encoded_tokens, encoded_tokens.ndim, max_contiguous_pad_length)
-        mapped_sequences = sequences.map(self._create_input_target)
+        mapped_sequences = sequences.map(self._create_input_target,
+                                         num_parallel_calls=data.experimental.AUTOTUNE)
+
+        # Caches the mapped sequences, avoiding re-computing them on every epoch,
+        # and only then promotes them, so that the cache keeps their narrow encoding
+        mapped_sequences = mapped_sequences.cache().map(self._cast_input_target,
+                                                        num_parallel_calls=data.experimental.AUTOTUNE)
 
         # Builds up the dataset class
         self._build(mapped_sequences, batch_size)
@@ -80,3 +87,21 @@ class LanguageModelingDataset(Dataset):
         target = sequence[1:]
 
         return _input, target
+
+    def _cast_input_target(self, _input, target):
+        """Promotes narrow integer inputs and targets to the type expected by the models.
+
+        Args:
+            _input (tensor): A tensor holding the input sequence.
+            target (tensor): A tensor holding the target sequence.
+
+        Returns:
+            Input and target tensors.
+
+        """
+
+        # Integer encodings are promoted to int32, while other types are kept untouched
+        if _input.dtype.is_integer:
+            _input, target = tf.cast(_input, tf.int32), tf.cast(target, tf.int32)
+
+        return _input, target
@@ -31,7 +31,7 @@ class IntegerEncoder(Encoder):
 
     @property
     def decoder(self):
-        """dict: A decoder dictionary.
+        """list: A decoder mapping indexes to tokens.
 
         """
 
@@ -46,7 +46,7 @@ class IntegerEncoder(Encoder):
 
         Args:
             dictionary (dict): The vocabulary to index mapping.
-            reverse_dictionary (dict): The index to vocabulary mapping.
+            reverse_dictionary (list): The index to vocabulary mapping.
 
         """
 
@@ -56,14 +56,37 @@ class IntegerEncoder(Encoder):
         # Creates the decoder property
         self.decoder = reverse_dictionary
 
+        # Gathers the narrowest integer type that holds every index,
+        # which reduces the memory (and bandwidth) of encoded tokens
+        self._dtype = np.min_scalar_type(max(dictionary.values(), default=0))
+        if self._dtype.itemsize > 2:
+            self._dtype = np.dtype(np.int32)
+
+        # Sorts the vocabulary tokens along with their indexes,
+        # which allows encoding arrays of tokens with a binary search
+        sorted_tokens = sorted(dictionary)
+        self._sorted_tokens = np.array(sorted_tokens)
+        self._sorted_indexes = np.array([dictionary[t] for t in sorted_tokens], dtype=self._dtype)
+
+        # Gathers the single-character tokens, e.g., from a character-level vocabulary
+        chars = [t for t in dictionary if isinstance(t, str) and len(t) == 1]
+
+        # Creates a lookup table mapping characters' code points to indexes, where
+        # the last position (and any absent character) holds the unknown token index
+        self._chars_lookup = None
+        if chars and c.UNK in dictionary:
+            self._chars_lookup = np.full(max(map(ord, chars)) + 2, dictionary[c.UNK], dtype=self._dtype)
+            for t in chars:
+                self._chars_lookup[ord(t)] = dictionary[t]
+
     def encode(self, tokens):
         """Encodes new tokens based on previous learning.
 
         Args:
-            tokens (list): A list of tokens to be encoded.
+            tokens (list): A list of tokens to be encoded, or a string to be encoded character-wise.
 
         Returns:
-            A numpy array of encoded tokens.
+            A numpy array of encoded tokens, using the narrowest integer type that holds the vocabulary indexes.
 
         """
 
@@ -74,6 +97,33 @@ class IntegerEncoder(Encoder):
 
             raise RuntimeError(e)
 
+        # Strings are encoded character-wise
+        if isinstance(tokens, str):
+            # Checks if characters can be directly looked up by their code points,
+            # which are gathered at once from the string's UTF-32 encoding
+            if self._chars_lookup is not None:
+                return self._encode_chars(np.frombuffer(tokens.encode('utf-32-le'), dtype=np.uint32))
+
+            tokens = list(tokens)
+
+        # Checks if tokens already are an array of strings, which can be encoded at once
+        # Note that lists are not converted, as building the array costs more than looking them up
+        if isinstance(tokens, np.ndarray) and tokens.dtype.kind == 'U':
+            # Each single character is stored as an UCS-4 value, thus, viewed as its code point
+            if tokens.dtype == np.dtype('U1') and self._chars_lookup is not None:
+                return self._encode_chars(np.ascontiguousarray(tokens).view(np.uint32))
+
+            if self._sorted_tokens.dtype.kind == 'U':
+                return self._encode_array(tokens)
+
+        # Checks if tokens are a flat list or tuple, which can be looked up into a pre-allocated array
+        # Note that any other iterable, such as a generator, is encoded element-wise
+        if isinstance(tokens, (list, tuple)) and tokens and not isinstance(tokens[0], (np.ndarray, list)):
+            unknown_index = self.encoder.get(c.UNK)
+
+            return np.fromiter((self.encoder.get(t, unknown_index) for t in tokens),
+                               dtype=self._dtype, count=len(tokens))
+
         encoded_tokens = []
 
         for token in tokens:
@@ -87,7 +137,48 @@ class IntegerEncoder(Encoder):
                 else:
                     encoded_tokens += [self.encoder[c.UNK]]
 
-        encoded_tokens = np.array(encoded_tokens, dtype=np.int32)
+        encoded_tokens = np.array(encoded_tokens, dtype=self._dtype)
+
+        return encoded_tokens
+
+    def _encode_chars(self, code_points):
+        """Encodes characters by indexing a lookup table with their code points.
+
+        Args:
+            code_points (np.array): An array of characters' code points to be encoded.
+
+        Returns:
+            A numpy array of encoded tokens.
+
+        """
+
+        # Characters beyond the lookup table are clipped to its last (unknown) position
+        code_points = np.minimum(code_points, len(self._chars_lookup) - 1)
+
+        return self._chars_lookup[code_points]
+
+    def _encode_array(self, tokens):
+        """Encodes an array of tokens by binary searching the sorted vocabulary.
+
+        Args:
+            tokens (np.array): An array of tokens to be encoded.
+
+        Returns:
+            A numpy array of encoded tokens.
+
+        """
+
+        # Gathers the position of every token in the sorted vocabulary
+        positions = np.searchsorted(self._sorted_tokens, tokens)
+        positions = np.minimum(positions, len(self._sorted_tokens) - 1)
+
+        # Gathers the indexes of the tokens
+        encoded_tokens = self._sorted_indexes[positions]
+
+        # Checks which tokens do not belong to the vocabulary and replaces them with an unknown token
+        unknown_tokens = self._sorted_tokens[positions] != tokens
+        if unknown_tokens.any():
+            encoded_tokens[unknown_tokens] = self.encoder[c.UNK]
 
         return encoded_tokens
 
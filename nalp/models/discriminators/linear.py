@@ -5,7 +5,7 @@ import tensorflow as tf
 from tensorflow.keras.layers import Dense
 
 import nalp.utils.logging as l
-from nalp.core import Discriminator
+from nalp.core.model import Discriminator
 
 logger = l.get_logger(__name__)
 
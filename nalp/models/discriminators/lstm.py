@@ -1,10 +1,11 @@
 """Long Short-Term Memory discriminator.
 """
 
-from tensorflow.keras.layers import RNN, Dense, LSTMCell
+import tensorflow as tf
+from tensorflow.keras.layers import LSTM, Dense
 
 import nalp.utils.logging as l
-from nalp.core import Discriminator
+from nalp.core.model import Discriminator
 
 logger = l.get_logger(__name__)
 
@@ -18,12 +19,13 @@ class LSTMDiscriminator(Discriminator):
 
     """
 
-    def __init__(self, embedding_size=32, hidden_size=64):
+    def __init__(self, embedding_size=32, hidden_size=64, vocab_size=1):
         """Initialization method.
 
         Args:
             embedding_size (int): The size of the embedding layer.
             hidden_size (int): The amount of hidden neurons.
+            vocab_size (int): The size of the vocabulary.
 
         """
 
@@ -31,35 +33,60 @@ class LSTMDiscriminator(Discriminator):
 
         super(LSTMDiscriminator, self).__init__(name='D_lstm')
 
+        # Defining a property for holding the vocabulary size
+        self.vocab_size = vocab_size
+
         # Creates an embedding layer
+        # Note that it is a linear layer, as the inputs might be (soft) distributions over the vocabulary
         self.embedding = Dense(embedding_size, name='embedding')
 
-        # Creates a LSTM cell
-        self.cell = LSTMCell(hidden_size, name='lstm_cell')
-
-        # Creates the RNN loop itself
-        self.rnn = RNN(self.cell, name='rnn_layer',
-                       return_sequences=True,
-                       stateful=True)
+        # Creates the LSTM layer itself, which uses the fused (cuDNN) kernel whenever available
+        # Note that it is stateless, as every input holds a whole sequence
+        self.rnn = LSTM(hidden_size, name='rnn_layer',
+                        return_sequences=True)
 
         # And finally, defining the output layer
-        self.out = Dense(1, name='out')
+        # Note that it always outputs `float32`, preserving the loss numerics under mixed precision
+        self.out = Dense(1, name='out', dtype='float32')
 
         logger.info('Class overrided.')
 
+    @property
+    def vocab_size(self):
+        """int: The size of the vocabulary.
+
+        """
+
+        return self._vocab_size
+
+    @vocab_size.setter
+    def vocab_size(self, vocab_size):
+        self._vocab_size = vocab_size
+
     def call(self, x):
         """Method that holds vital information whenever this class is called.
 
         Args:
-            x (tf.tensor): A tensorflow's tensor holding input data.
+            x (tf.tensor): A tensorflow's tensor holding input data, either tokens' indexes
+                or distributions over the vocabulary.
 
         Returns:
             The same tensor after passing through each defined layer.
 
         """
 
-        # Firstly, we apply the embedding layer
-        x = self.embedding(x)
+        # Checks if the inputs are tokens' indexes
+        if x.dtype.is_integer:
+            # Makes sure the embedding layer's weights exist
+            if not self.embedding.built:
+                self.embedding.build((None, self.vocab_size))
+
+            # Gathers the embedding layer's rows, which equals applying it to one-hot encoded tokens
+            x = tf.gather(self.embedding.kernel, x) + self.embedding.bias
+
+        else:
+            # Firstly, we apply the embedding layer
+            x = self.embedding(x)
 
         # We need to apply the input into the first recurrent layer
         x = self.rnn(x)
@@ -2,10 +2,10 @@
 """
 
 import tensorflow as tf
-from tensorflow.keras.layers import Conv2D, Dense, Dropout, MaxPool1D
+from tensorflow.keras.layers import Conv1D, Dense, Dropout
 
 import nalp.utils.logging as l
-from nalp.core import Discriminator
+from nalp.core.model import Discriminator
 
 logger = l.get_logger(__name__)
 
@@ -21,7 +21,8 @@ class TextDiscriminator(Discriminator):
         """Initialization method.
 
         Args:
-            max_length (int): Maximum length of the sequences.
+            max_length (int): Maximum length of the sequences (unused, as the pooling is
+                performed over the whole sequence, but kept for compatibility).
             embedding_size (int): The size of the embedding layer.
             n_filters (tuple): Number of filters to be applied.
             filters_size (tuple): Size of filters to be applied.
@@ -36,13 +37,14 @@ class TextDiscriminator(Discriminator):
         # Creates an embedding layer
         self.embedding = Dense(embedding_size, name='embedding')
 
-        # Defining a list for holding the convolutional layers
-        self.conv = [Conv2D(n, (k, embedding_size), strides=(
-            1, 1), padding='valid', name=f'conv_{k}') for n, k in zip(n_filters, filters_size)]
+        # Gathers the number of filters per filter size, as filters with
+        # the same size are grouped into a single convolutional layer
+        filters_per_size = {}
+        for n, k in zip(n_filters, filters_size):
+            filters_per_size[k] = filters_per_size.get(k, 0) + n
 
-        # Defining a list for holding the pooling layers
-        self.pool = [MaxPool1D(max_length - k + 1, 1, name=f'pool_{k}')
-                     for k in filters_size]
+        # Defining a list for holding the convolutional layers
+        self.conv = [Conv1D(n, k, strides=1, padding='valid', name=f'conv_{k}') for k, n in filters_per_size.items()]
 
         # Defining a linear layer for serving as the `highway`
         self.highway = Dense(sum(n_filters), name='highway')
@@ -67,15 +69,12 @@ class TextDiscriminator(Discriminator):
         # Passing down the embedding layer
         x = self.embedding(x)
 
-        # Expanding the last dimension
-        x = tf.expand_dims(x, -1)
+        # Passing down the convolutional layers, which slide over the sequence dimension
+        # while spanning the whole embedding, following a ReLU activation
+        convs = [tf.nn.relu(conv(x)) for conv in self.conv]
 
-        # Passing down the convolutional layers following a ReLU activation
-        # and removal of third dimension
-        convs = [tf.squeeze(tf.nn.relu(conv(x)), 2) for conv in self.conv]
-
-        # Passing down the pooling layers per convolutional layer
-        pools = [pool(conv) for pool, conv in zip(self.pool, convs)]
+        # Pooling the maximum over the whole sequence per convolutional layer
+        pools = [tf.math.reduce_max(conv, 1, keepdims=True) for conv in convs]
 
         # Concatenating all the pooling outputs into a single tensor
         x = tf.concat(pools, 2)
@@ -83,8 +82,11 @@ class TextDiscriminator(Discriminator):
         # Calculating the output of the linear layer
         hw = self.highway(x)
 
+        # Calculating the `highway` layer gate
+        gate = tf.math.sigmoid(hw)
+
         # Calculating the `highway` layer
-        x = tf.math.sigmoid(hw) * tf.nn.relu(hw) + (1 - tf.math.sigmoid(hw)) * x
+        x = gate * tf.nn.relu(hw) + (1 - gate) * x
 
         # Calculating the output with a dropout regularization
         x = self.drop(x, training=training)
@@ -2,7 +2,7 @@
 """
 
 import nalp.utils.logging as l
-from nalp.core import Adversarial
+from nalp.core.model import Adversarial
 from nalp.models.discriminators import LinearDiscriminator
 from nalp.models.generators import LinearGenerator
 
@@ -5,7 +5,7 @@ import tensorflow as tf
 from tensorflow.keras.layers import BatchNormalization, Conv2DTranspose, Dense
 
 import nalp.utils.logging as l
-from nalp.core import Generator
+from nalp.core.model import Generator
 
 logger = l.get_logger(__name__)
 
@@ -4,7 +4,7 @@
 from tensorflow.keras.layers import RNN, Dense, Embedding, GRUCell
 
 import nalp.utils.logging as l
-from nalp.core import Generator
+from nalp.core.model import Generator
 
 logger = l.get_logger(__name__)
 
@@ -37,8 +37,8 @@ class GumbelLSTMGenerator(LSTMGenerator):
         # Defining a property to hold the Gumbel-Softmax temperature parameter
         self.tau = tau
 
-        # Creates a Gumbel-Softmax layer
-        self.gumbel = GumbelSoftmax(name='gumbel')
+        # Creates a Gumbel-Softmax layer, which always samples in `float32`
+        self.gumbel = GumbelSoftmax(name='gumbel', dtype='float32')
 
         logger.info('Class overrided.')
 
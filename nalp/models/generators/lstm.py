@@ -1,10 +1,10 @@
 """Long Short-Term Memory generator.
 """
 
-from tensorflow.keras.layers import RNN, Dense, Embedding, LSTMCell
+from tensorflow.keras.layers import LSTM, Dense, Embedding
 
 import nalp.utils.logging as l
-from nalp.core import Generator
+from nalp.core.model import Generator
 
 logger = l.get_logger(__name__)
 
@@ -40,16 +40,17 @@ class LSTMGenerator(Generator):
         self.embedding = Embedding(
             vocab_size, embedding_size, name='embedding')
 
-        # Creates a LSTM cell
-        self.cell = LSTMCell(hidden_size, name='lstm_cell')
+        # Creates the LSTM layer itself, which uses the fused (cuDNN) kernel whenever available
+        self.rnn = LSTM(hidden_size, name='rnn_layer',
+                        return_sequences=True,
+                        stateful=True)
 
-        # Creates the RNN loop itself
-        self.rnn = RNN(self.cell, name='rnn_layer',
-                       return_sequences=True,
-                       stateful=True)
+        # Exposes its cell, allowing single-step calls that avoid the fused kernel overhead
+        self.cell = self.rnn.cell
 
         # Creates the linear (Dense) layer
-        self.linear = Dense(vocab_size, name='out')
+        # Note that it always outputs `float32`, preserving the loss and sampling numerics under mixed precision
+        self.linear = Dense(vocab_size, name='out', dtype='float32')
 
         logger.info('Class overrided.')
 
@@ -1,10 +1,11 @@
 """Stacked Recurrent Neural Network generator.
 """
 
+import tensorflow as tf
 from tensorflow.keras.layers import RNN, Dense, Embedding, SimpleRNNCell
 
 import nalp.utils.logging as l
-from nalp.core import Generator
+from nalp.core.model import Generator
 
 logger = l.get_logger(__name__)
 
@@ -18,7 +19,8 @@ class StackedRNNGenerator(Generator):
 
     """
 
-    def __init__(self, encoder=None, vocab_size=1, embedding_size=32, hidden_size=(64, 64)):
+    def __init__(self, encoder=None, vocab_size=1, embedding_size=32, hidden_size=(64, 64), n_sampled=0,
+                 stateful=True):
         """Initialization method.
 
         Args:
@@ -26,6 +28,11 @@ class StackedRNNGenerator(Generator):
             vocab_size (int): The size of the vocabulary.
             embedding_size (int): The size of the embedding layer.
             hidden_size (tuple): Amount of hidden neurons per cell.
+            n_sampled (int): Number of sampled classes when training with a sampled softmax loss
+                (zero uses the compiled loss over the full vocabulary). Note that enabling it
+                after initialization is not supported.
+            stateful (bool): Whether hidden states are kept between calls. Stateless models
+                do not require a fixed batch size, while generating text requires a stateful one.
 
         """
 
@@ -36,6 +43,9 @@ class StackedRNNGenerator(Generator):
         # Creates a property for holding the used encoder
         self.encoder = encoder
 
+        # Creates a property for holding the number of sampled classes
+        self.n_sampled = n_sampled
+
         # Creates an embedding layer
         self.embedding = Embedding(vocab_size, embedding_size, name='embedding')
 
@@ -46,10 +56,20 @@ class StackedRNNGenerator(Generator):
         # Creates the RNN loop itself
         self.rnn = RNN(self.cells, name='rnn_layer',
                        return_sequences=True,
-                       stateful=True)
+                       stateful=stateful)
 
         # Creates the linear (Dense) layer
-        self.linear = Dense(vocab_size, name='out')
+        # Note that its outputs are kept as `float32` to be numerically stable
+        # when training under a mixed precision policy
+        self.linear = Dense(vocab_size, name='out', dtype='float32')
+
+        # Builds the linear layer beforehand, as the sampled softmax loss uses its weights
+        # without calling it, and variables should not be created while tracing the training step
+        self.linear.build((None, hidden_size[-1]))
+
+        # Creates a tracker for the sampled softmax loss, which replaces the compiled loss one
+        # Note that it is only created when needed, otherwise it would shadow the compiled loss
+        self.sampled_loss_tracker = tf.keras.metrics.Mean(name='loss') if n_sampled else None
 
         logger.debug('Number of cells: %d.', len(hidden_size))
         logger.info('Class overrided.')
@@ -66,6 +86,100 @@ class StackedRNNGenerator(Generator):
     def encoder(self, encoder):
         self._encoder = encoder
 
+    @property
+    def n_sampled(self):
+        """int: Number of sampled classes when training with a sampled softmax loss.
+
+        """
+
+        return self._n_sampled
+
+    @n_sampled.setter
+    def n_sampled(self, n_sampled):
+        self._n_sampled = n_sampled
+
+    def train_step(self, data):
+        """Performs a single batch optimization step.
+
+        If `n_sampled` is provided, the output layer's logits are only calculated for
+        the target and sampled classes, which avoids back-propagating through the whole vocabulary.
+        Note that the compiled loss is replaced by the sampled softmax loss, while the compiled
+        metrics are skipped, as they would require the full logits. Use `evaluate` to calculate them.
+
+        Args:
+            data (tuple): A tuple containing the inputs, their labels and optional sample weights.
+
+        Returns:
+            A dictionary holding the loss (and metrics) values.
+
+        """
+
+        if not self.n_sampled:
+            return super(StackedRNNGenerator, self).train_step(data)
+
+        x, y, sample_weight = tf.keras.utils.unpack_x_y_sample_weight(data)
+
+        # Using tensorflow's gradient
+        with tf.GradientTape() as tape:
+            # Calculate the outputs of the recurrent layers and flattens their timesteps
+            outputs = self.rnn(self.embedding(x))
+            outputs = tf.cast(tf.reshape(outputs, [-1, outputs.shape[-1]]), tf.float32)
+
+            # Flattens the labels into a column of targets
+            labels = tf.reshape(tf.cast(y, tf.int64), [-1, 1])
+
+            # Calculate the loss over the target and sampled classes of the output layer
+            losses = tf.nn.sampled_softmax_loss(tf.transpose(self.linear.kernel), self.linear.bias,
+                                                labels, outputs, self.n_sampled, self.linear.units)
+
+            # Weights the loss of every timestep, whether weights are given per sample or per timestep
+            if sample_weight is not None:
+                sample_weight = tf.reshape(tf.cast(sample_weight, losses.dtype), [tf.shape(y)[0], -1])
+                losses *= tf.reshape(tf.broadcast_to(sample_weight, tf.shape(y)), [-1])
+
+            # Averages the loss and adds any regularization losses
+            loss = tf.reduce_mean(losses) + tf.add_n([0.0] + self.losses)
+
+            # Scales the loss, as gradients are summed across replicas under a distribution strategy
+            scaled_loss = loss / tf.distribute.get_strategy().num_replicas_in_sync
+
+        # Minimizes the loss, which also applies loss scaling under a mixed precision policy
+        self.optimizer.minimize(scaled_loss, self.trainable_variables, tape=tape)
+
+        # Updates the loss tracker
+        self.sampled_loss_tracker.update_state(loss)
+
+        return {'loss': self.sampled_loss_tracker.result()}
+
+    def test_step(self, data):
+        """Performs a single batch evaluation step.
+
+        If `n_sampled` is provided, the compiled loss over the full vocabulary is
+        reported through the sampled softmax loss tracker, which would otherwise shadow it.
+
+        Args:
+            data (tuple): A tuple containing the inputs, their labels and optional sample weights.
+
+        Returns:
+            A dictionary holding the loss and metrics values.
+
+        """
+
+        if not self.n_sampled:
+            return super(StackedRNNGenerator, self).test_step(data)
+
+        x, y, sample_weight = tf.keras.utils.unpack_x_y_sample_weight(data)
+
+        # Calculates the full logits
+        preds = self(x, training=False)
+
+        # Updates the loss tracker with the compiled loss and the compiled metrics
+        self.sampled_loss_tracker.update_state(
+            self.compiled_loss(y, preds, sample_weight, regularization_losses=self.losses))
+        self.compiled_metrics.update_state(y, preds, sample_weight)
+
+        return {m.name: m.result() for m in self.metrics}
+
     def call(self, x):
         """Method that holds vital information whenever this class is called.
 
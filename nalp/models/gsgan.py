@@ -5,7 +5,7 @@ import tensorflow as tf
 from tensorflow.keras.utils import Progbar
 
 import nalp.utils.logging as l
-from nalp.core import Adversarial
+from nalp.core.model import Adversarial
 from nalp.models.discriminators import LSTMDiscriminator
 from nalp.models.generators import GumbelLSTMGenerator
 
@@ -38,7 +38,7 @@ class GSGAN(Adversarial):
         logger.info('Overriding class: Adversarial -> GSGAN.')
 
         # Creating the discriminator network
-        D = LSTMDiscriminator(embedding_size, hidden_size)
+        D = LSTMDiscriminator(embedding_size, hidden_size, vocab_size)
 
         # Creating the generator network
         G = GumbelLSTMGenerator(encoder, vocab_size, embedding_size, hidden_size, tau)
@@ -87,6 +87,14 @@ class GSGAN(Adversarial):
 
         """
 
+        # Wraps the optimizers with a dynamic loss scale under a `mixed_float16` policy,
+        # as the float16 gradients might underflow otherwise
+        if tf.keras.mixed_precision.global_policy().name == 'mixed_float16':
+            pre_optimizer, d_optimizer, g_optimizer = [
+                o if isinstance(o, tf.keras.mixed_precision.LossScaleOptimizer)
+                else tf.keras.mixed_precision.LossScaleOptimizer(o)
+                for o in (pre_optimizer, d_optimizer, g_optimizer)]
+
         # Creates optimizers for pre-training, discriminator and generator
         self.P_optimizer = pre_optimizer
         self.D_optimizer = d_optimizer
@@ -120,31 +128,31 @@ class GSGAN(Adversarial):
         # Gathers the batch size and maximum sequence length
         batch_size, max_length = x.shape[0], x.shape[1]
 
-        # Gathering the first token from the input tensor and expanding its last dimension
-        start_batch = tf.expand_dims(x[:, 0], -1)
-
-        # Creating an empty tensor for holding the Gumbel-Softmax predictions
-        sampled_preds = tf.zeros([batch_size, 0, self.vocab_size])
+        # Gathering the first token from the input tensor
+        start_batch = x[:, 0]
 
-        # Copying the sampled batch with the start batch tokens
-        sampled_batch = start_batch
+        # Creating empty lists for holding the Gumbel-Softmax predictions and the sampled batches,
+        # which are stacked only once after the generation
+        sampled_preds, sampled_batch = [], []
 
-        # Resetting the network states
-        self.G.reset_states()
+        # Gathers the initial (zero) states of the generator's cell,
+        # which are threaded explicitly instead of resetting the recurrent layer ones
+        states = self.G.cell.get_initial_state(batch_size=batch_size, dtype=self.G.cell.compute_dtype)
 
         # For every possible generation
         for _ in range(max_length):
             # Predicts the current token
-            _, preds, start_batch = self.G(start_batch)
-
-            # Concatenates the predictions with the tensor
-            sampled_preds = tf.concat([sampled_preds, preds], 1)
+            preds, states = self.G.cell(self.G.embedding(start_batch), states)
+            preds, start_batch = self.G.gumbel(self.G.linear(preds), self.G.tau)
 
-            # Concatenates the sampled batch with the predicted batch
-            sampled_batch = tf.concat([sampled_batch, start_batch], 1)
+            # Appends the predictions and the predicted batch to their lists
+            sampled_preds.append(preds)
+            sampled_batch.append(start_batch)
 
-        # Ignoring the first column to get the target sampled batch
-        sampled_batch = sampled_batch[:, 1:]
+        # Stacks the predictions and the sampled batches along the sequence dimension
+        # Note that the start batch tokens are not included, as only the target sampled batch is needed
+        sampled_preds = tf.stack(sampled_preds, 1)
+        sampled_batch = tf.stack(sampled_batch, 1)
 
         return sampled_batch, sampled_preds
 
@@ -198,12 +206,9 @@ class GSGAN(Adversarial):
             # Calculate the loss
             loss = tf.reduce_mean(tf.nn.sparse_softmax_cross_entropy_with_logits(y, logits))
 
-        # Calculate the gradient based on loss for each training variable
-        gradients = tape.gradient(loss, self.G.trainable_variables)
-
-        # Apply gradients using an optimizer
-        self.P_optimizer.apply_gradients(
-            zip(gradients, self.G.trainable_variables))
+        # Calculate the gradients based on loss for each training variable and apply them using an optimizer
+        # Note that minimizing with the tape also scales the loss under a `mixed_float16` policy
+        self.P_optimizer.minimize(loss, self.G.trainable_variables, tape=tape)
 
         # Updates the generator's loss state
         self.G_loss.update_state(loss)
@@ -226,22 +231,18 @@ class GSGAN(Adversarial):
             # Samples fake targets from D(G(x))
             y_fake = self.D(x_fake_probs)
 
-            # Extends the target tensor to an one-hot encoding representation
-            # and samples real targets from D(x)
-            y = tf.one_hot(y, self.vocab_size)
+            # Samples real targets from D(x)
+            # Note that the targets are not one-hot encoded, as the discriminator gathers their embeddings
             y_real = self.D(y)
 
             # Calculates both losses
             D_loss = self._discriminator_loss(y_real, y_fake)
             G_loss = self._generator_loss(y_fake)
 
-        # Calculate both gradients
-        D_gradients = D_tape.gradient(D_loss, self.D.trainable_variables)
-        G_gradients = G_tape.gradient(G_loss, self.G.trainable_variables)
-
-        # Applies both gradients using an optimizer
-        self.D_optimizer.apply_gradients(zip(D_gradients, self.D.trainable_variables))
-        self.G_optimizer.apply_gradients(zip(G_gradients, self.G.trainable_variables))
+        # Calculate both gradients and apply them using an optimizer
+        # Note that minimizing with the tapes also scales the losses under a `mixed_float16` policy
+        self.D_optimizer.minimize(D_loss, self.D.trainable_variables, tape=D_tape)
+        self.G_optimizer.minimize(G_loss, self.G.trainable_variables, tape=G_tape)
 
         # Updates both loss states
         self.D_loss.update_state(D_loss)
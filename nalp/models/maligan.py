@@ -1,13 +1,12 @@
 """Maximum-Likelihood Augmented Discrete Generative Adversarial Network.
 """
 
-import numpy as np
 import tensorflow as tf
 from tensorflow.keras.utils import Progbar
 
 import nalp.utils.constants as c
 import nalp.utils.logging as l
-from nalp.core import Adversarial
+from nalp.core.model import Adversarial
 from nalp.models.discriminators import EmbeddedTextDiscriminator
 from nalp.models.generators import LSTMGenerator
 
@@ -58,6 +57,9 @@ class MaliGAN(Adversarial):
         # Defining a property for holding the temperature
         self.T = temperature
 
+        # Defining a cache for holding the discriminator's labels per batch size
+        self._label_cache = {}
+
         logger.info('Class overrided.')
 
     @property
@@ -94,6 +96,14 @@ class MaliGAN(Adversarial):
 
         """
 
+        # Wraps the optimizers with a dynamic loss scale under a `mixed_float16` policy,
+        # as the float16 gradients might underflow otherwise
+        if tf.keras.mixed_precision.global_policy().name == 'mixed_float16':
+            pre_optimizer, d_optimizer, g_optimizer = [
+                o if isinstance(o, tf.keras.mixed_precision.LossScaleOptimizer)
+                else tf.keras.mixed_precision.LossScaleOptimizer(o)
+                for o in (pre_optimizer, d_optimizer, g_optimizer)]
+
         # Creates optimizers for pre-training, discriminator and generator
         self.P_optimizer = pre_optimizer
         self.D_optimizer = d_optimizer
@@ -112,10 +122,35 @@ class MaliGAN(Adversarial):
         self.history['D_loss'] = []
         self.history['G_loss'] = []
 
-    def generate_batch(self, batch_size=1, length=1):
+    def generate_batch(self, batch_size=1, length=1, temperature=None):
         """Generates a batch of tokens by feeding to the network the
         current token (t) and predicting the next token (t+1).
 
+        Args:
+            batch_size (int): Size of the batch to be generated.
+            length (int): Length of generated tokens.
+            temperature (float): A temperature value to sample the token. If not supplied,
+                uses the model's temperature.
+
+        Returns:
+            A (batch_size, length) tensor of generated tokens.
+
+        """
+
+        if temperature is None:
+            temperature = self.T
+
+        return self._generate_batch(batch_size, length, temperature)
+
+    @tf.function(input_signature=[tf.TensorSpec([], 'int32'), tf.TensorSpec([], 'int32'),
+                                  tf.TensorSpec([], 'float32')])
+    def _generate_batch(self, batch_size, length, temperature):
+        """Generates a batch of tokens within a single graph.
+
+        Note that the generator's cell is stepped directly, threading its states
+        explicitly instead of resetting and carrying the recurrent layer ones. Also,
+        as the arguments are traced as tensors, a single graph serves any of their values.
+
         Args:
             batch_size (int): Size of the batch to be generated.
             length (int): Length of generated tokens.
@@ -126,32 +161,40 @@ class MaliGAN(Adversarial):
 
         """
 
+        # Draws a seed for this generation and splits it into a seed per sampling,
+        # which allows using stateless random operations inside the loop
+        seeds = tf.random.experimental.stateless_split(
+            tf.random.uniform([2], 0, tf.int32.max, dtype='int32'), length + 1)
+
         # Generating an uniform tensor between 0 and vocab_size
-        start_batch = tf.random.uniform(
-            [batch_size, 1], 0, self.vocab_size, dtype='int32')
+        start_batch = tf.random.stateless_uniform(
+            [batch_size], seeds[0], 0, self.vocab_size, dtype='int32')
 
-        # Copying the sampled batch with the start batch tokens
-        sampled_batch = start_batch
+        # Creates an array for holding the start batch and every sampled batch
+        sampled_batch = tf.TensorArray('int32', size=length + 1)
+        sampled_batch = sampled_batch.write(0, start_batch)
 
-        # Resetting the network states
-        self.G.reset_states()
+        # Gathers the initial (zero) states of the generator's cell
+        states = self.G.cell.get_initial_state(batch_size=batch_size, dtype=self.G.cell.compute_dtype)
 
         # For every possible generation
-        for _ in range(length):
+        for i in tf.range(length):
             # Predicts the current token
-            preds = self.G(start_batch)
-
-            # Removes the second dimension of the tensor
-            preds = tf.squeeze(preds, 1)
+            preds, states = self.G.cell(self.G.embedding(start_batch), states)
+            preds = self.G.linear(preds)
 
             # Regularize the prediction with the temperature
-            preds /= self.T
+            preds /= temperature
 
-            # Samples a predicted batch
-            start_batch = tf.random.categorical(preds, 1, dtype='int32')
+            # Samples a predicted batch and removes its second dimension
+            start_batch = tf.squeeze(tf.random.stateless_categorical(
+                preds, 1, seeds[i + 1], dtype='int32'), 1)
 
-            # Concatenates the sampled batch with the predicted batch
-            sampled_batch = tf.concat([sampled_batch, start_batch], 1)
+            # Writes the predicted batch right after the current token
+            sampled_batch = sampled_batch.write(i + 1, start_batch)
+
+        # Stacks the sampled batches into a (batch_size, length + 1) tensor
+        sampled_batch = tf.transpose(sampled_batch.stack())
 
         # Ignoring the last column to get the input sampled batch
         x_sampled_batch = sampled_batch[:, :length]
@@ -161,6 +204,42 @@ class MaliGAN(Adversarial):
 
         return x_sampled_batch, y_sampled_batch
 
+    @tf.function(input_signature=[tf.TensorSpec([None, None], 'int32'), tf.TensorSpec([], 'float32')])
+    def _concat_fake_batch(self, x, temperature):
+        """Generates a batch of fake inputs and concatenates it after the real inputs.
+
+        Args:
+            x (tf.tensor): A tensor containing the real inputs.
+            temperature (float): A temperature value to sample the fake tokens.
+
+        Returns:
+            A (2 * batch_size, length) tensor of real and fake inputs.
+
+        """
+
+        # Generates a batch of fake inputs
+        x_fake, _ = self._generate_batch(tf.shape(x)[0], tf.shape(x)[1], temperature)
+
+        return tf.concat([x, x_fake], 0)
+
+    def _concat_labels(self, batch_size):
+        """Gathers the labels of concatenated real and fake inputs, which are cached per batch size.
+
+        Args:
+            batch_size (int): Size of the real (and fake) batch.
+
+        Returns:
+            A (2 * batch_size,) tensor holding label 0 for real samples and label 1 for fake samples.
+
+        """
+
+        if batch_size not in self._label_cache:
+            self._label_cache[batch_size] = tf.concat(
+                [tf.zeros(batch_size, dtype='int32'), tf.ones(batch_size, dtype='int32')], 0)
+
+        return self._label_cache[batch_size]
+
+    @tf.function(input_signature=[tf.TensorSpec([None, None], 'int32')])
     def _get_reward(self, x):
         """Calculates rewards over an input using a Maximum-Likelihood approach.
 
@@ -169,9 +248,6 @@ class MaliGAN(Adversarial):
 
         """
 
-        # Gathers the batch size and maximum sequence length
-        batch_size, max_length = x.shape[0], x.shape[1]
-
         # Calculates the positive part of the discriminator's output
         rewards = tf.squeeze(self.D(x), 1)[:, 1]
 
@@ -181,9 +257,9 @@ class MaliGAN(Adversarial):
         # Normalizes the tensor
         rewards = tf.math.divide(rewards, tf.math.reduce_sum(rewards))
 
-        # Broadcasts the tensor along the max_length dimensions
-        rewards = tf.broadcast_to(tf.expand_dims(
-            rewards, 1), [batch_size, max_length])
+        # Expands the tensor along the max_length dimension,
+        # which is broadcasted when multiplying the generator's loss
+        rewards = tf.expand_dims(rewards, 1)
 
         return rewards
 
@@ -205,12 +281,9 @@ class MaliGAN(Adversarial):
             # Calculate the loss
             loss = tf.reduce_mean(self.loss(y, preds))
 
-        # Calculate the gradient based on loss for each training variable
-        gradients = tape.gradient(loss, self.G.trainable_variables)
-
-        # Apply gradients using an optimizer
-        self.P_optimizer.apply_gradients(
-            zip(gradients, self.G.trainable_variables))
+        # Calculate the gradients based on loss for each training variable and apply them using an optimizer
+        # Note that minimizing with the tape also scales the loss under a `mixed_float16` policy
+        self.P_optimizer.minimize(loss, self.G.trainable_variables, tape=tape)
 
         # Updates the generator's loss state
         self.G_loss.update_state(loss)
@@ -234,17 +307,14 @@ class MaliGAN(Adversarial):
             # Calculate the loss
             loss = tf.reduce_mean(self.loss(y, preds) * rewards)
 
-        # Calculate the gradient based on loss for each training variable
-        gradients = tape.gradient(loss, self.G.trainable_variables)
-
-        # Apply gradients using an optimizer
-        self.G_optimizer.apply_gradients(
-            zip(gradients, self.G.trainable_variables))
+        # Calculate the gradients based on loss for each training variable and apply them using an optimizer
+        # Note that minimizing with the tape also scales the loss under a `mixed_float16` policy
+        self.G_optimizer.minimize(loss, self.G.trainable_variables, tape=tape)
 
         # Updates the generator's loss state
         self.G_loss.update_state(loss)
 
-    @tf.function
+    @tf.function(jit_compile=True)
     def D_step(self, x, y):
         """Performs a single batch optimization step over the discriminator.
 
@@ -262,16 +332,36 @@ class MaliGAN(Adversarial):
             # Calculate the loss
             loss = tf.reduce_mean(self.loss(y, preds))
 
-        # Calculate the gradient based on loss for each training variable
-        gradients = tape.gradient(loss, self.D.trainable_variables)
-
-        # Apply gradients using an optimizer
-        self.D_optimizer.apply_gradients(
-            zip(gradients, self.D.trainable_variables))
+        # Calculate the gradients based on loss for each training variable and apply them using an optimizer
+        # Note that minimizing with the tape also scales the loss under a `mixed_float16` policy
+        self.D_optimizer.minimize(loss, self.D.trainable_variables, tape=tape)
 
         # Updates the discriminator's loss state
         self.D_loss.update_state(loss)
 
+    @tf.function
+    def D_steps(self, x, y, n_steps):
+        """Performs multiple batch optimization steps over the discriminator,
+        where each step randomly selects half of the inputs.
+
+        Args:
+            x (tf.tensor): A tensor containing the inputs.
+            y (tf.tensor): A tensor containing the inputs' labels.
+            n_steps (int): Number of optimization steps.
+
+        """
+
+        # Gathers the amount of inputs
+        n_inputs = tf.shape(x)[0]
+
+        # For a fixed amount of discriminator steps
+        for _ in tf.range(n_steps):
+            # Performs a random samples selection of half the inputs
+            indices = tf.random.shuffle(tf.range(n_inputs))[:n_inputs // 2]
+
+            # Performs the optimization step over the discriminator
+            self.D_step(tf.gather(x, indices), tf.gather(y, indices))
+
     def pre_fit(self, batches, g_epochs=50, d_epochs=10):
         """Pre-trains the model.
 
@@ -322,28 +412,17 @@ class MaliGAN(Adversarial):
             b = Progbar(n_batches, stateful_metrics=['loss(D)'])
 
             for x_batch, _ in batches:
-                # Gathering the batch size and the maximum sequence length
-                batch_size, max_length = x_batch.shape[0], x_batch.shape[1]
-
-                # Generates a batch of fake inputs
-                x_fake_batch, _ = self.generate_batch(batch_size, max_length)
+                # Gathering the batch size
+                batch_size = x_batch.shape[0]
 
-                # Concatenates real inputs and fake inputs into a single tensor
-                x_concat_batch = tf.concat([x_batch, x_fake_batch], 0)
+                # Generates a batch of fake inputs and concatenates it with the real inputs
+                x_concat_batch = self._concat_fake_batch(x_batch, self.T)
 
-                # Creates a tensor holding label 0 for real samples and label 1 for fake samples
-                y_concat_batch = tf.concat(
-                    [tf.zeros(batch_size, dtype='int32'), tf.ones(batch_size, dtype='int32')], 0)
+                # Gathers the labels, holding label 0 for real samples and label 1 for fake samples
+                y_concat_batch = self._concat_labels(batch_size)
 
-                # For a fixed amount of discriminator steps
-                for _ in range(c.D_STEPS):
-                    # Performs a random samples selection of batch size
-                    indices = np.random.choice(
-                        x_concat_batch.shape[0], batch_size, replace=False)
-
-                    # Performs the optimization step over the discriminator
-                    self.D_step(tf.gather(x_concat_batch, indices),
-                                tf.gather(y_concat_batch, indices))
+                # Performs a fixed amount of optimization steps over the discriminator
+                self.D_steps(x_concat_batch, y_concat_batch, c.D_STEPS)
 
                 # Adding corresponding values to the progress bar
                 b.add(1, values=[('loss(D)', self.D_loss.result())])
@@ -382,28 +461,16 @@ class MaliGAN(Adversarial):
                 # Gathering the batch size and the maximum sequence length
                 batch_size, max_length = x_batch.shape[0], x_batch.shape[1]
 
+                # Gathers the labels, holding label 0 for real samples and label 1 for fake samples
+                y_concat_batch = self._concat_labels(batch_size)
+
                 # Iterate through all possible discriminator's epochs
                 for _ in range(d_epochs):
-                    # Generates a batch of fake inputs
-                    x_fake_batch, _ = self.generate_batch(
-                        batch_size, max_length)
-
-                    # Concatenates real inputs and fake inputs into a single tensor
-                    x_concat_batch = tf.concat([x_batch, x_fake_batch], 0)
-
-                    # Creates a tensor holding label 0 for real samples and label 1 for fake samples
-                    y_concat_batch = tf.concat(
-                        [tf.zeros(batch_size, dtype='int32'), tf.ones(batch_size, dtype='int32')], 0)
-
-                    # For a fixed amount of discriminator steps
-                    for _ in range(c.D_STEPS):
-                        # Performs a random samples selection of batch size
-                        indices = np.random.choice(
-                            x_concat_batch.shape[0], batch_size, replace=False)
-
-                        # Performs the optimization step over the discriminator
-                        self.D_step(tf.gather(x_concat_batch, indices),
-                                    tf.gather(y_concat_batch, indices))
+                    # Generates a batch of fake inputs and concatenates it with the real inputs
+                    x_concat_batch = self._concat_fake_batch(x_batch, self.T)
+
+                    # Performs a fixed amount of optimization steps over the discriminator
+                    self.D_steps(x_concat_batch, y_concat_batch, c.D_STEPS)
 
                 # Generates a batch of fake inputs
                 x_fake_batch, y_fake_batch = self.generate_batch(
@@ -5,7 +5,7 @@ import tensorflow as tf
 from tensorflow.keras.utils import Progbar
 
 import nalp.utils.logging as l
-from nalp.core import Adversarial
+from nalp.core.model import Adversarial
 from nalp.models.discriminators import TextDiscriminator
 from nalp.models.generators import GumbelRMCGenerator
 
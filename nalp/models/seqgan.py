@@ -1,13 +1,12 @@
 """Sequence Generative Adversarial Network.
 """
 
-import numpy as np
 import tensorflow as tf
 from tensorflow.keras.utils import Progbar
 
 import nalp.utils.constants as c
 import nalp.utils.logging as l
-from nalp.core import Adversarial
+from nalp.core.model import Adversarial
 from nalp.models.discriminators import EmbeddedTextDiscriminator
 from nalp.models.generators import LSTMGenerator
 
@@ -57,6 +56,9 @@ class SeqGAN(Adversarial):
         # Defining a property for holding the temperature
         self.T = temperature
 
+        # Defining a cache for holding the discriminator's labels per batch size
+        self._label_cache = {}
+
         logger.info('Class overrided.')
 
     @property
@@ -93,6 +95,14 @@ class SeqGAN(Adversarial):
 
         """
 
+        # Wraps the optimizers with a dynamic loss scale under a `mixed_float16` policy,
+        # as the float16 gradients might underflow otherwise
+        if tf.keras.mixed_precision.global_policy().name == 'mixed_float16':
+            pre_optimizer, d_optimizer, g_optimizer = [
+                o if isinstance(o, tf.keras.mixed_precision.LossScaleOptimizer)
+                else tf.keras.mixed_precision.LossScaleOptimizer(o)
+                for o in (pre_optimizer, d_optimizer, g_optimizer)]
+
         # Creates optimizers for pre-training, discriminator and generator
         self.P_optimizer = pre_optimizer
         self.D_optimizer = d_optimizer
@@ -111,10 +121,35 @@ class SeqGAN(Adversarial):
         self.history['D_loss'] = []
         self.history['G_loss'] = []
 
-    def generate_batch(self, batch_size=1, length=1):
+    def generate_batch(self, batch_size=1, length=1, temperature=None):
         """Generates a batch of tokens by feeding to the network the
         current token (t) and predicting the next token (t+1).
 
+        Args:
+            batch_size (int): Size of the batch to be generated.
+            length (int): Length of generated tokens.
+            temperature (float): A temperature value to sample the token. If not supplied,
+                uses the model's temperature.
+
+        Returns:
+            A (batch_size, length) tensor of generated tokens.
+
+        """
+
+        if temperature is None:
+            temperature = self.T
+
+        return self._generate_batch(batch_size, length, temperature)
+
+    @tf.function(input_signature=[tf.TensorSpec([], 'int32'), tf.TensorSpec([], 'int32'),
+                                  tf.TensorSpec([], 'float32')])
+    def _generate_batch(self, batch_size, length, temperature):
+        """Generates a batch of tokens within a single graph.
+
+        Note that the generator's cell is stepped directly, threading its states
+        explicitly instead of resetting and carrying the recurrent layer ones. Also,
+        as the arguments are traced as tensors, a single graph serves any of their values.
+
         Args:
             batch_size (int): Size of the batch to be generated.
             length (int): Length of generated tokens.
@@ -125,32 +160,40 @@ class SeqGAN(Adversarial):
 
         """
 
+        # Draws a seed for this generation and splits it into a seed per sampling,
+        # which allows using stateless random operations inside the loop
+        seeds = tf.random.experimental.stateless_split(
+            tf.random.uniform([2], 0, tf.int32.max, dtype='int32'), length + 1)
+
         # Generating an uniform tensor between 0 and vocab_size
-        start_batch = tf.random.uniform(
-            [batch_size, 1], 0, self.vocab_size, dtype='int32')
+        start_batch = tf.random.stateless_uniform(
+            [batch_size], seeds[0], 0, self.vocab_size, dtype='int32')
 
-        # Copying the sampled batch with the start batch tokens
-        sampled_batch = start_batch
+        # Creates an array for holding the start batch and every sampled batch
+        sampled_batch = tf.TensorArray('int32', size=length + 1)
+        sampled_batch = sampled_batch.write(0, start_batch)
 
-        # Resetting the network states
-        self.G.reset_states()
+        # Gathers the initial (zero) states of the generator's cell
+        states = self.G.cell.get_initial_state(batch_size=batch_size, dtype=self.G.cell.compute_dtype)
 
         # For every possible generation
-        for _ in range(length):
+        for i in tf.range(length):
             # Predicts the current token
-            preds = self.G(start_batch)
-
-            # Removes the second dimension of the tensor
-            preds = tf.squeeze(preds, 1)
+            preds, states = self.G.cell(self.G.embedding(start_batch), states)
+            preds = self.G.linear(preds)
 
             # Regularize the prediction with the temperature
-            preds /= self.T
+            preds /= temperature
+
+            # Samples a predicted batch and removes its second dimension
+            start_batch = tf.squeeze(tf.random.stateless_categorical(
+                preds, 1, seeds[i + 1], dtype='int32'), 1)
 
-            # Samples a predicted batch
-            start_batch = tf.random.categorical(preds, 1, dtype='int32')
+            # Writes the predicted batch right after the current token
+            sampled_batch = sampled_batch.write(i + 1, start_batch)
 
-            # Concatenates the sampled batch with the predicted batch
-            sampled_batch = tf.concat([sampled_batch, start_batch], 1)
+        # Stacks the sampled batches into a (batch_size, length + 1) tensor
+        sampled_batch = tf.transpose(sampled_batch.stack())
 
         # Ignoring the last column to get the input sampled batch
         x_sampled_batch = sampled_batch[:, :length]
@@ -160,9 +203,49 @@ class SeqGAN(Adversarial):
 
         return x_sampled_batch, y_sampled_batch
 
+    @tf.function(input_signature=[tf.TensorSpec([None, None], 'int32'), tf.TensorSpec([], 'float32')])
+    def _concat_fake_batch(self, x, temperature):
+        """Generates a batch of fake inputs and concatenates it after the real inputs.
+
+        Args:
+            x (tf.tensor): A tensor containing the real inputs.
+            temperature (float): A temperature value to sample the fake tokens.
+
+        Returns:
+            A (2 * batch_size, length) tensor of real and fake inputs.
+
+        """
+
+        # Generates a batch of fake inputs
+        x_fake, _ = self._generate_batch(tf.shape(x)[0], tf.shape(x)[1], temperature)
+
+        return tf.concat([x, x_fake], 0)
+
+    def _concat_labels(self, batch_size):
+        """Gathers the labels of concatenated real and fake inputs, which are cached per batch size.
+
+        Args:
+            batch_size (int): Size of the real (and fake) batch.
+
+        Returns:
+            A (2 * batch_size,) tensor holding label 0 for real samples and label 1 for fake samples.
+
+        """
+
+        if batch_size not in self._label_cache:
+            self._label_cache[batch_size] = tf.concat(
+                [tf.zeros(batch_size, dtype='int32'), tf.ones(batch_size, dtype='int32')], 0)
+
+        return self._label_cache[batch_size]
+
+    @tf.function(input_signature=[tf.TensorSpec([None, None], 'int32'), tf.TensorSpec([], 'int32')])
     def _get_reward(self, x, n_rollouts):
         """Calculates rewards over an input using a Monte Carlo search strategy.
 
+        Note that every rollout is tiled along the batch dimension, thus they are
+        sampled and scored by the discriminator at once. Also, as the steps are looped
+        within the graph, a single graph serves any input shape and number of rollouts.
+
         Args:
             x (tf.tensor): A tensor containing the inputs.
             n_rollouts (int): Number of rollouts for conducting the Monte Carlo search.
@@ -170,44 +253,50 @@ class SeqGAN(Adversarial):
         """
 
         # Gathers the batch size and maximum sequence length
-        batch_size, max_length = x.shape[0], x.shape[1]
+        batch_size, max_length = tf.shape(x)[0], tf.shape(x)[1]
+
+        # Tiles the inputs, stacking every rollout along the batch dimension
+        x = tf.tile(x, [n_rollouts, 1])
 
-        # Creates an empty tensor for holding the rewards
-        rewards = tf.zeros([1, batch_size])
+        # Gathers the initial (zero) states of the generator's cell
+        states = self.G.cell.get_initial_state(
+            batch_size=n_rollouts * batch_size, dtype=self.G.cell.compute_dtype)
 
-        for _ in range(n_rollouts):
-            # For every possible sequence step
-            for step in range(1, max_length + 1):
-                # Resetting the network states
-                self.G.reset_states()
+        # Creates an array for holding the rewards of every step
+        rewards = tf.TensorArray('float32', size=max_length)
 
-                # Calculate and gathers the last step output
-                output = self.G(x)[:, -1, :]
+        # For every possible sequence step
+        for step in tf.range(1, max_length + 1):
+            # Feeds the current step token, gathering the output and states upon to the current step
+            output, states = self.G.cell(self.G.embedding(x[:, step - 1]), states)
 
-                # Gathers the input upon to the current step
-                samples = x[:, :step]
+            # Creates an array holding the input tokens, whose ones after the current step
+            # are overwritten by the rollout
+            samples = tf.TensorArray('int32', size=max_length).unstack(tf.transpose(x))
 
-                # For every possible value ranging from step to maximum length
-                for _ in range(step, max_length):
-                    # Calculates the output
-                    output = tf.random.categorical(output, 1, dtype='int32')
+            # Copies the output and states to carry on the rollout
+            rollout_output, rollout_states = output, states
 
-                    # Concatenates the samples with the output
-                    samples = tf.concat([samples, output], 1)
+            # For every possible value ranging from step to maximum length
+            for t in tf.range(step, max_length):
+                # Calculates the output and removes its second dimension
+                sample = tf.squeeze(tf.random.categorical(self.G.linear(rollout_output), 1, dtype='int32'), 1)
 
-                    # Squeezes the second dimension of the output tensor
-                    output = tf.squeeze(self.G(output), 1)
+                # Writes the output to the samples
+                samples = samples.write(t, sample)
 
-                # Calculates the softmax over the discriminator output and removes the second dimension
-                output = tf.squeeze(tf.math.softmax(self.D(samples)), 1)
+                # Feeds the sampled token to the generator's cell
+                rollout_output, rollout_states = self.G.cell(self.G.embedding(sample), rollout_states)
 
-                # Concatenates and accumulates the rewards tensor for every step
-                rewards = tf.concat(
-                    [rewards, tf.expand_dims(output[:, 1], 0)], 0)
+            # Calculates the softmax over the discriminator output and removes the second dimension
+            output = tf.squeeze(tf.math.softmax(self.D(tf.transpose(samples.stack()))), 1)
 
-        # Calculates the mean over the rewards tensor
-        rewards = tf.reduce_mean(tf.reshape(
-            rewards[1:, :], [batch_size, max_length, n_rollouts]), -1)
+            # Calculates the mean over the rollouts and writes the reward of the current step
+            rewards = rewards.write(step - 1, tf.reduce_mean(
+                tf.reshape(tf.cast(output[:, 1], 'float32'), [n_rollouts, batch_size]), 0))
+
+        # Stacks the rewards of every step into a (batch_size, max_length) tensor
+        rewards = tf.transpose(rewards.stack())
 
         return rewards
 
@@ -229,12 +318,9 @@ class SeqGAN(Adversarial):
             # Calculate the loss
             loss = tf.reduce_mean(self.loss(y, preds))
 
-        # Calculate the gradient based on loss for each training variable
-        gradients = tape.gradient(loss, self.G.trainable_variables)
-
-        # Apply gradients using an optimizer
-        self.P_optimizer.apply_gradients(
-            zip(gradients, self.G.trainable_variables))
+        # Calculate the gradients based on loss for each training variable and apply them using an optimizer
+        # Note that minimizing with the tape also scales the loss under a `mixed_float16` policy
+        self.P_optimizer.minimize(loss, self.G.trainable_variables, tape=tape)
 
         # Updates the generator's loss state
         self.G_loss.update_state(loss)
@@ -258,17 +344,14 @@ class SeqGAN(Adversarial):
             # Calculate the loss
             loss = tf.reduce_mean(self.loss(y, preds) * rewards)
 
-        # Calculate the gradient based on loss for each training variable
-        gradients = tape.gradient(loss, self.G.trainable_variables)
-
-        # Apply gradients using an optimizer
-        self.G_optimizer.apply_gradients(
-            zip(gradients, self.G.trainable_variables))
+        # Calculate the gradients based on loss for each training variable and apply them using an optimizer
+        # Note that minimizing with the tape also scales the loss under a `mixed_float16` policy
+        self.G_optimizer.minimize(loss, self.G.trainable_variables, tape=tape)
 
         # Updates the generator's loss state
         self.G_loss.update_state(loss)
 
-    @tf.function
+    @tf.function(jit_compile=True)
     def D_step(self, x, y):
         """Performs a single batch optimization step over the discriminator.
 
@@ -286,16 +369,36 @@ class SeqGAN(Adversarial):
             # Calculate the loss
             loss = tf.reduce_mean(self.loss(y, preds))
 
-        # Calculate the gradient based on loss for each training variable
-        gradients = tape.gradient(loss, self.D.trainable_variables)
-
-        # Apply gradients using an optimizer
-        self.D_optimizer.apply_gradients(
-            zip(gradients, self.D.trainable_variables))
+        # Calculate the gradients based on loss for each training variable and apply them using an optimizer
+        # Note that minimizing with the tape also scales the loss under a `mixed_float16` policy
+        self.D_optimizer.minimize(loss, self.D.trainable_variables, tape=tape)
 
         # Updates the discriminator's loss state
         self.D_loss.update_state(loss)
 
+    @tf.function
+    def D_steps(self, x, y, n_steps):
+        """Performs multiple batch optimization steps over the discriminator,
+        where each step randomly selects half of the inputs.
+
+        Args:
+            x (tf.tensor): A tensor containing the inputs.
+            y (tf.tensor): A tensor containing the inputs' labels.
+            n_steps (int): Number of optimization steps.
+
+        """
+
+        # Gathers the amount of inputs
+        n_inputs = tf.shape(x)[0]
+
+        # For a fixed amount of discriminator steps
+        for _ in tf.range(n_steps):
+            # Performs a random samples selection of half the inputs
+            indices = tf.random.shuffle(tf.range(n_inputs))[:n_inputs // 2]
+
+            # Performs the optimization step over the discriminator
+            self.D_step(tf.gather(x, indices), tf.gather(y, indices))
+
     def pre_fit(self, batches, g_epochs=50, d_epochs=10):
         """Pre-trains the model.
 
@@ -346,28 +449,17 @@ class SeqGAN(Adversarial):
             b = Progbar(n_batches, stateful_metrics=['loss(D)'])
 
             for x_batch, _ in batches:
-                # Gathering the batch size and the maximum sequence length
-                batch_size, max_length = x_batch.shape[0], x_batch.shape[1]
+                # Gathering the batch size
+                batch_size = x_batch.shape[0]
 
-                # Generates a batch of fake inputs
-                x_fake_batch, _ = self.generate_batch(batch_size, max_length)
+                # Generates a batch of fake inputs and concatenates it with the real inputs
+                x_concat_batch = self._concat_fake_batch(x_batch, self.T)
 
-                # Concatenates real inputs and fake inputs into a single tensor
-                x_concat_batch = tf.concat([x_batch, x_fake_batch], 0)
+                # Gathers the labels, holding label 0 for real samples and label 1 for fake samples
+                y_concat_batch = self._concat_labels(batch_size)
 
-                # Creates a tensor holding label 0 for real samples and label 1 for fake samples
-                y_concat_batch = tf.concat(
-                    [tf.zeros(batch_size, dtype='int32'), tf.ones(batch_size, dtype='int32')], 0)
-
-                # For a fixed amount of discriminator steps
-                for _ in range(c.D_STEPS):
-                    # Performs a random samples selection of batch size
-                    indices = np.random.choice(
-                        x_concat_batch.shape[0], batch_size, replace=False)
-
-                    # Performs the optimization step over the discriminator
-                    self.D_step(tf.gather(x_concat_batch, indices),
-                                tf.gather(y_concat_batch, indices))
+                # Performs a fixed amount of optimization steps over the discriminator
+                self.D_steps(x_concat_batch, y_concat_batch, c.D_STEPS)
 
                 # Adding corresponding values to the progress bar
                 b.add(1, values=[('loss(D)', self.D_loss.result())])
@@ -420,28 +512,16 @@ class SeqGAN(Adversarial):
                     # Performs the optimization step over the generator
                     self.G_step(x_fake_batch, y_fake_batch, rewards)
 
+                # Gathers the labels, holding label 0 for real samples and label 1 for fake samples
+                y_concat_batch = self._concat_labels(batch_size)
+
                 # Iterate through all possible discriminator's epochs
                 for _ in range(d_epochs):
-                    # Generates a batch of fake inputs
-                    x_fake_batch, _ = self.generate_batch(
-                        batch_size, max_length)
-
-                    # Concatenates real inputs and fake inputs into a single tensor
-                    x_concat_batch = tf.concat([x_batch, x_fake_batch], 0)
-
-                    # Creates a tensor holding label 0 for real samples and label 1 for fake samples
-                    y_concat_batch = tf.concat(
-                        [tf.zeros(batch_size, dtype='int32'), tf.ones(batch_size, dtype='int32')], 0)
-
-                    # For a fixed amount of discriminator steps
-                    for _ in range(c.D_STEPS):
-                        # Performs a random samples selection of batch size
-                        indices = np.random.choice(
-                            x_concat_batch.shape[0], batch_size, replace=False)
+                    # Generates a batch of fake inputs and concatenates it with the real inputs
+                    x_concat_batch = self._concat_fake_batch(x_batch, self.T)
 
-                        # Performs the optimization step over the discriminator
-                        self.D_step(tf.gather(x_concat_batch, indices),
-                                    tf.gather(y_concat_batch, indices))
+                    # Performs a fixed amount of optimization steps over the discriminator
+                    self.D_steps(x_concat_batch, y_concat_batch, c.D_STEPS)
 
                 # Adding corresponding values to the progress bar
                 b.add(1, values=[('loss(G)', self.G_loss.result()),
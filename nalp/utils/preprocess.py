@@ -2,6 +2,7 @@
 """
 
 import re
+from functools import partial
 
 import nltk
 
@@ -9,6 +10,13 @@ import nalp.utils.logging as l
 
 logger = l.get_logger(__name__)
 
+# Pattern that matches characters which are not valid
+_INVALID_CHAR = re.compile(r'[^a-zA-z0-9\s]')
+
+# Translation table that deletes invalid ASCII characters, which is
+# considerably faster than the regular expression for ASCII-only strings
+_INVALID_ASCII_CHAR = {i: None for i in range(128) if _INVALID_CHAR.match(chr(i))}
+
 
 def lower_case(s):
     """Transforms an input string into its lower case version.
@@ -35,7 +43,15 @@ def valid_char(s):
 
     """
 
-    return re.sub('[^a-zA-z0-9\s]', '', s)
+    # Checks whether the string is ASCII-only, as `str.isascii()` requires Python 3.7
+    try:
+        s.encode('ascii')
+
+    # Non-ASCII strings (including lone surrogates) are validated with the regular expression
+    except UnicodeEncodeError:
+        return _INVALID_CHAR.sub('', s)
+
+    return s.translate(_INVALID_ASCII_CHAR)
 
 
 def tokenize_to_char(s):
@@ -77,12 +93,28 @@ def pipeline(*func):
 
     """
 
-    def process(x):
-        for f in func:
-            x = f(x)
-
-        return x
+    # Binds the functions to a module-level processor, which keeps
+    # the pipeline picklable and usable by worker processes
+    process = partial(_process, func)
 
     logger.debug('Pipeline created with %s.', str(func))
 
     return process
+
+
+def _process(func, x):
+    """Applies a sequence of pre-processing functions.
+
+    Args:
+        func (tuple): Functions pointers.
+        x (str): Input string.
+
+    Returns:
+        The input after being processed by every function.
+
+    """
+
+    for f in func:
+        x = f(x)
+
+    return x
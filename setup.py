@@ -19,7 +19,7 @@ setup(name='nalp',
                         'nltk>=3.5',
                         'pylint>=2.7.2',
                         'pytest>=6.2.2',
-                        'tensorflow>=2.4.1'
+                        'tensorflow>=2.5.0'
                         ],
       extras_require={
           'tests': ['coverage',